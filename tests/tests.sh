@@ -141,6 +141,109 @@ run --full --word-breaks -p patterns-rotate-abc test8
 diff -r original/humpty-dumpty.txt test8/humpty-dumpty.txt || expect_error
 
 
+# Whole files at once, which for these patterns should be the same as line by line.
+
+cp -a original test12
+
+run --at-once -p patterns-misc test12
+
+diff -r test4 test12
+
+
+# Parallel rewrites, which should do and log the same as sequential ones.
+
+cp -a original test10
+
+cp -a original test11
+
+run -p patterns-misc test10 2> test10.log
+
+run -j 2 -p patterns-misc test11 2> test11.log
+
+diff <(sed s/test10/test11/ test10.log) test11.log
+
+diff -r test10 test11
+
+run -p patterns-overlap test10 2> test10.log
+
+run -j 2 -p patterns-overlap test11 2> test11.log
+
+diff <(sed s/test10/test11/ test10.log) test11.log
+
+diff -r test10 test11
+
+run -j -1 -p patterns-misc test11 || expect_error
+
+
+# Overlapping matches.
+
+echo "abc xbc xaaaa" | run -p patterns-overlap
+
+
+# Repeated regexes.
+
+echo "foo" | run -p patterns-duplicates
+
+
+# Backreferences.
+
+echo "aab aaab" | run -p patterns-backrefs
+
+
+# Conditional group references.
+
+echo "<a> a" | run -p patterns-conditional
+
+
+# Patterns that may match differently in a whole file than line by line.
+
+printf "one  two\n three\n\nfour\n" > test13.txt
+
+cp test13.txt test14.txt
+
+run -p patterns-lines test13.txt
+
+cat test13.txt
+
+run --from 'e$' --to 'E' test14.txt
+
+cat test14.txt
+
+
+# Text rather than bytes, as paths and stdin are on Python 3.
+
+cp -a original test15
+
+python3 $prog --renames --from humpty --to dumpty test15
+
+ls_portable test15
+
+echo "humpty dumpty" | python3 $prog --from '(\w+) (\w+)' --to '\2 \1'
+
+
+# Walking directories with scandir, as on Python 3, which should find the same files in the same order as os.walk.
+
+cp -a original test16
+
+mkdir test16/.excluded
+
+touch test16/.excluded/excluded.txt test16/stuff/backup.txt.orig
+
+ln -s stuff test16/stuff-link
+
+python3 -c '
+import sys, types
+repren = types.ModuleType("repren")
+exec(open(sys.argv[1]).read(), repren.__dict__)
+assert repren.scandir is not None
+scanned = list(repren.walk_files([sys.argv[2]]))
+repren.scandir = None
+walked = list(repren.walk_files([sys.argv[2]]))
+assert scanned == walked, (scanned, walked)
+print("\n".join(sorted(scanned)))
+' $prog test16
+
+
 # Moving files.
 
 # TODO: Fix this.